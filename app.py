@@ -14,25 +14,50 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-if 'transactions' not in st.session_state:
-    st.session_state.transactions = pd.DataFrame()
+DEFAULT_ENTITY_ID = 'household'
+
+if 'entities' not in st.session_state:
+    st.session_state.entities = {
+        DEFAULT_ENTITY_ID: {
+            'name': 'Household',
+            'accounts': {
+                'rental': 'Rental Income (0111)',
+                'realestate': 'Real Estate (8529)',
+                'business': 'Business Income (7991)',
+                'expenses': 'Business Expenses (2299)',
+                'chase': 'Chase Visa Prime (2434)'
+            },
+            'rental_accounts': ['rental'],
+            'business_accounts': ['business'],
+            'expense_accounts': ['chase', 'expenses'],
+            'properties': [
+                {'id': '2111_9th', 'name': '2111 9th Street', 'value': 353000},
+                {'id': '2024_50th', 'name': '2024 50th Street', 'value': 274500},
+                {'id': '1112_36th', 'name': '1112 36th St W', 'value': 432000},
+                {'id': '5th_st_e', 'name': '5th ST E', 'value': 305000},
+                {'id': '37th_ave_e', 'name': '37th Ave E', 'value': 281500},
+                {'id': '61st_ave_ter', 'name': '61st Ave Ter E', 'value': 335000},
+                {'id': '59th_ave_e', 'name': '59th Ave E', 'value': 319000},
+                {'id': '2nd_st_w', 'name': '2nd St W', 'value': 350000},
+                {'id': 'harbor_st', 'name': 'Harbor St', 'value': 75000},
+                {'id': 'las_palmas', 'name': 'Las Palmas', 'value': 250000},
+                {'id': 'primary_home', 'name': '4156 Cascade Falls (Primary)', 'value': 405000},
+                {'id': 'summer_home', 'name': '91 River Run (Summer)', 'value': 380000}
+            ]
+        }
+    }
+# Transactions are partitioned as partitions[entity_id][account_key] -> DataFrame so
+# that every query only touches the selected entity's frames.
+if 'partitions' not in st.session_state:
+    st.session_state.partitions = {}
+if 'partition_sources' not in st.session_state:
+    st.session_state.partition_sources = {}
+# Per-partition Schedule E totals indexed by (year, property, tax_line), adjusted
+# by the grouped totals of added or edited rows only.
+if 'schedule_e_aggregates' not in st.session_state:
+    st.session_state.schedule_e_aggregates = {}
 if 'monthly_history' not in st.session_state:
     st.session_state.monthly_history = {}
-if 'properties' not in st.session_state:
-    st.session_state.properties = [
-        {'id': '2111_9th', 'name': '2111 9th Street', 'value': 353000},
-        {'id': '2024_50th', 'name': '2024 50th Street', 'value': 274500},
-        {'id': '1112_36th', 'name': '1112 36th St W', 'value': 432000},
-        {'id': '5th_st_e', 'name': '5th ST E', 'value': 305000},
-        {'id': '37th_ave_e', 'name': '37th Ave E', 'value': 281500},
-        {'id': '61st_ave_ter', 'name': '61st Ave Ter E', 'value': 335000},
-        {'id': '59th_ave_e', 'name': '59th Ave E', 'value': 319000},
-        {'id': '2nd_st_w', 'name': '2nd St W', 'value': 350000},
-        {'id': 'harbor_st', 'name': 'Harbor St', 'value': 75000},
-        {'id': 'las_palmas', 'name': 'Las Palmas', 'value': 250000},
-        {'id': 'primary_home', 'name': '4156 Cascade Falls (Primary)', 'value': 405000},
-        {'id': 'summer_home', 'name': '91 River Run (Summer)', 'value': 380000}
-    ]
 
 AUTO_CATEGORIES = {
     'capital_hvac': [r'air.*condition', r'hvac', r'heating.*system', r'furnace', r'heat.*pump', r'ac.*unit', r'central.*air'],
@@ -48,11 +73,24 @@ AUTO_CATEGORIES = {
     'utilities': [r'electric', r'gas.*company', r'water.*bill', r'internet', r'phone', r'cable', r'vyve', r'frontier', r'netflix', r'streaming'],
     'insurance': [r'insurance', r'premium', r'policy.*payment', r'coverage'],
     'property_maintenance': [r'maintenance', r'repair', r'landscaping', r'cleaning', r'pest.*control', r'small.*repair', r'handyman', r'lawn.*care'],
-    'property_expenses': [r'property.*tax', r'hoa', r'property.*management'],
+    'property_expenses': [r'property.*tax', r'hoa'],
+    'property_management': [r'property.*management', r'management.*fee'],
     'business_expenses': [r'office.*supplies', r'software', r'subscription', r'travel', r'meeting', r'equipment', r'computer', r'professional.*services'],
     'personal_expenses': [r'grocery', r'restaurant', r'gas.*station', r'retail', r'shopping', r'amazon', r'target', r'walmart', r'costco']
 }
 
+SCHEDULE_E_LINES = {
+    'rental_income': 'Rents Received',
+    'property_maintenance': 'Repairs & Maintenance',
+    'utilities': 'Utilities',
+    'insurance': 'Insurance',
+    'property_expenses': 'Taxes & HOA',
+    'property_management': 'Management Fees'
+}
+SCHEDULE_E_CAPITAL_LINE = 'Capital Items (Depreciation)'
+SCHEDULE_E_COLUMNS = list(SCHEDULE_E_LINES.values()) + [SCHEDULE_E_CAPITAL_LINE]
+SCHEDULE_E_EXPENSE_COLUMNS = [label for key, label in SCHEDULE_E_LINES.items() if key != 'rental_income']
+
 def auto_categorize_transaction(description):
     desc_lower = description.lower()
     for category, patterns in AUTO_CATEGORIES.items():
@@ -61,7 +99,80 @@ def auto_categorize_transaction(description):
                 return category
     return 'uncategorized'
 
-def process_csv_file(uploaded_file, account_type):
+def make_entity_key(name):
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+def get_entity_transactions(entity_id):
+    account_frames = [frame for frame in st.session_state.partitions.get(entity_id, {}).values() if not frame.empty]
+    if not account_frames:
+        return pd.DataFrame()
+    return pd.concat(account_frames).sort_values('date', ascending=False)
+
+def calculate_schedule_e_aggregates(df, rental_accounts):
+    assigned = df[df['property'].fillna('') != '']
+    is_rent = (assigned['category'] == 'rental_income') | (assigned['account'].isin(rental_accounts) & (assigned['amount'] > 0))
+    tax_line = assigned['category'].map(SCHEDULE_E_LINES).mask(is_rent, SCHEDULE_E_LINES['rental_income'])
+    tax_line = tax_line.mask(assigned['is_capital'].astype(bool), SCHEDULE_E_CAPITAL_LINE)
+    assigned = assigned.assign(tax_line=tax_line).dropna(subset=['tax_line']).set_index('date')
+    return assigned.groupby([assigned.index.year.rename('year'), 'property', 'tax_line'])['amount'].sum()
+
+def adjust_schedule_e_aggregates(entity_id, account_type, added_rows, removed_rows=None):
+    rental_accounts = st.session_state.entities[entity_id]['rental_accounts']
+    entity_aggregates = st.session_state.schedule_e_aggregates.setdefault(entity_id, {})
+    
+    deltas = [calculate_schedule_e_aggregates(added_rows, rental_accounts)]
+    if account_type in entity_aggregates:
+        deltas.append(entity_aggregates[account_type])
+    if removed_rows is not None:
+        deltas.append(-calculate_schedule_e_aggregates(removed_rows, rental_accounts))
+    
+    aggregates = pd.concat(deltas).groupby(level=['year', 'property', 'tax_line']).sum().round(2)
+    entity_aggregates[account_type] = aggregates[aggregates != 0]
+
+def merge_partition(entity_id, account_type, incoming_df):
+    assert incoming_df.index.is_unique, f"Duplicate transaction keys in {account_type} upload"
+    entity_partitions = st.session_state.partitions.setdefault(entity_id, {})
+    existing = entity_partitions.get(account_type)
+    if existing is None:
+        new_rows = incoming_df
+        entity_partitions[account_type] = incoming_df
+    else:
+        new_rows = incoming_df[~incoming_df.index.isin(existing.index)]
+        entity_partitions[account_type] = pd.concat([existing, new_rows])
+    adjust_schedule_e_aggregates(entity_id, account_type, new_rows)
+    return len(new_rows)
+
+def get_schedule_e_years(entity_id):
+    years = set()
+    for aggregates in st.session_state.schedule_e_aggregates.get(entity_id, {}).values():
+        years.update(aggregates.index.get_level_values('year'))
+    return sorted(years, reverse=True)
+
+def build_schedule_e_report(entity_id, year, properties):
+    account_aggregates = [aggregates for aggregates in st.session_state.schedule_e_aggregates.get(entity_id, {}).values() if not aggregates.empty]
+    if not account_aggregates:
+        return pd.DataFrame()
+    
+    totals = pd.concat(account_aggregates).groupby(level=['year', 'property', 'tax_line']).sum()
+    if year not in totals.index.get_level_values('year'):
+        return pd.DataFrame()
+    
+    report = totals.xs(year, level='year').unstack('tax_line', fill_value=0)
+    report = report.reindex(columns=SCHEDULE_E_COLUMNS, fill_value=0)
+    outflow_columns = SCHEDULE_E_EXPENSE_COLUMNS + [SCHEDULE_E_CAPITAL_LINE]
+    report[outflow_columns] = -report[outflow_columns]
+    report['Total Expenses'] = report[SCHEDULE_E_EXPENSE_COLUMNS].sum(axis=1)
+    report['Net Rental Income'] = report['Rents Received'] - report['Total Expenses']
+    
+    property_names = {prop['id']: prop['name'] for prop in properties}
+    report.index = [property_names.get(prop_id, prop_id) for prop_id in report.index]
+    report.index.name = 'Property'
+    report.columns.name = None
+    report.loc['Total'] = report.sum()
+    
+    return report.round(2)
+
+def process_csv_file(uploaded_file, account_type, expense_accounts):
     try:
         try:
             df = pd.read_csv(uploaded_file)
@@ -161,7 +272,7 @@ def process_csv_file(uploaded_file, account_type):
         
         processed_df = pd.DataFrame(processed_data)
         
-        if account_type in ['chase', 'expenses']:
+        if account_type in expense_accounts:
             processed_df['amount'] = processed_df['amount'].apply(lambda x: -abs(x) if x > 0 else x)
         
         processed_df['category'] = processed_df['description'].apply(auto_categorize_transaction)
@@ -169,9 +280,14 @@ def process_csv_file(uploaded_file, account_type):
         processed_df['property'] = ''
         processed_df['notes'] = ''
         
-        processed_df = processed_df.dropna(subset=['date'])
+        processed_df = processed_df.dropna(subset=['date', 'amount'])
         processed_df = processed_df[processed_df['amount'] != 0]
         
+        key_columns = ['date', 'description', 'amount']
+        occurrence = processed_df.groupby(key_columns, dropna=False).cumcount()
+        row_keys = pd.util.hash_pandas_object(processed_df[key_columns].assign(occurrence=occurrence), index=False)
+        processed_df.index = [f"{account_type}_{key:016x}" for key in row_keys]
+        
         if not processed_df.empty:
             st.sidebar.write(f"**Sample processed data:**")
             sample = processed_df[['date', 'description', 'amount']].head(3)
@@ -183,7 +299,7 @@ def process_csv_file(uploaded_file, account_type):
         st.sidebar.error(f"Error processing {account_type} CSV: {str(e)}")
         return pd.DataFrame()
 
-def calculate_monthly_stats(df, target_month=None, target_year=None):
+def calculate_monthly_stats(df, rental_accounts, business_accounts, target_month=None, target_year=None):
     if df.empty:
         return {
             'rental_income': 0,
@@ -201,10 +317,10 @@ def calculate_monthly_stats(df, target_month=None, target_year=None):
         df_month = df[(df['date'].dt.month == current_date.month) & (df['date'].dt.year == current_date.year)]
     
     rental_income = df_month[(df_month['category'] == 'rental_income') | 
-                            ((df_month['account'] == 'rental') & (df_month['amount'] > 0))]['amount'].sum()
+                            (df_month['account'].isin(rental_accounts) & (df_month['amount'] > 0))]['amount'].sum()
     
     business_income = df_month[(df_month['category'] == 'business_income') | 
-                              ((df_month['account'] == 'business') & (df_month['amount'] > 0))]['amount'].sum()
+                              (df_month['account'].isin(business_accounts) & (df_month['amount'] > 0))]['amount'].sum()
     
     operating_expenses = df_month[(df_month['amount'] < 0) & (~df_month['is_capital'])]['amount'].abs().sum()
     
@@ -225,40 +341,102 @@ def main():
     st.title("🏦 Business & Rental Income Tracker Pro")
     st.markdown("**Advanced Financial Management with Auto-Categorization**")
     
+    st.sidebar.title("👥 Entity")
+    
+    entity_id = st.sidebar.selectbox(
+        "Portfolio Owner",
+        list(st.session_state.entities.keys()),
+        format_func=lambda key: st.session_state.entities[key]['name'],
+        key="entity_select"
+    )
+    entity = st.session_state.entities[entity_id]
+    
+    with st.sidebar.expander("⚙️ Manage Entities"):
+        new_entity_name = st.text_input("New Entity Name", key="new_entity_name")
+        if st.button("➕ Add Entity"):
+            new_entity_id = make_entity_key(new_entity_name)
+            if not new_entity_id:
+                st.warning("Enter an entity name")
+            elif new_entity_id in st.session_state.entities:
+                st.warning(f"Entity '{new_entity_id}' already exists")
+            else:
+                st.session_state.entities[new_entity_id] = {
+                    'name': new_entity_name.strip(),
+                    'accounts': {},
+                    'rental_accounts': [],
+                    'business_accounts': [],
+                    'expense_accounts': [],
+                    'properties': []
+                }
+                st.rerun()
+        
+        new_account_name = st.text_input(f"New Account for {entity['name']}", key=f"new_account_{entity_id}")
+        account_roles = {
+            'Other': None,
+            'Rental Income': 'rental_accounts',
+            'Business Income': 'business_accounts',
+            'Expense / Credit Card': 'expense_accounts'
+        }
+        new_account_role = st.selectbox("Account Role", list(account_roles.keys()), key=f"new_account_role_{entity_id}")
+        if st.button("➕ Add Account"):
+            account_key = make_entity_key(new_account_name)
+            if not account_key:
+                st.warning("Enter an account name")
+            elif account_key in entity['accounts']:
+                st.warning(f"Account '{account_key}' already exists")
+            else:
+                entity['accounts'][account_key] = new_account_name.strip()
+                if account_roles[new_account_role]:
+                    entity[account_roles[new_account_role]].append(account_key)
+                st.rerun()
+        
+        new_property_name = st.text_input(f"New Property for {entity['name']}", key=f"new_property_{entity_id}")
+        new_property_value = st.number_input("Property Value", min_value=0, step=1000, key=f"new_property_value_{entity_id}")
+        if st.button("➕ Add Property"):
+            property_id = make_entity_key(new_property_name)
+            if not property_id:
+                st.warning("Enter a property name")
+            elif property_id in [prop['id'] for prop in entity['properties']]:
+                st.warning(f"Property '{property_id}' already exists")
+            else:
+                entity['properties'].append({'id': property_id, 'name': new_property_name.strip(), 'value': new_property_value})
+                st.rerun()
+    
     st.sidebar.title("📁 Upload CSV Files")
     
-    account_types = {
-        'rental': 'Rental Income (0111)',
-        'realestate': 'Real Estate (8529)', 
-        'business': 'Business Income (7991)',
-        'expenses': 'Business Expenses (2299)',
-        'chase': 'Chase Visa Prime (2434)'
-    }
+    account_types = entity['accounts']
+    properties = entity['properties']
+    entity_partitions = st.session_state.partitions.setdefault(entity_id, {})
+    entity_sources = st.session_state.partition_sources.setdefault(entity_id, {})
+    entity_history = st.session_state.monthly_history.setdefault(entity_id, {})
+    
+    if not account_types:
+        st.sidebar.info("Add an account under Manage Entities to upload CSV files.")
     
     uploaded_files = {}
     for account_key, account_name in account_types.items():
         uploaded_files[account_key] = st.sidebar.file_uploader(
             f"{account_name}",
             type=['csv'],
-            key=f"upload_{account_key}"
+            key=f"upload_{entity_id}_{account_key}"
         )
     
-    all_dfs = []
     for account_type, file in uploaded_files.items():
-        if file is not None:
-            df = process_csv_file(file, account_type)
+        if file is None:
+            continue
+        if entity_sources.get(account_type) != file.file_id:
+            df = process_csv_file(file, account_type, entity['expense_accounts'])
             if not df.empty:
-                all_dfs.append(df)
-                st.sidebar.success(f"✅ {account_types[account_type]}: {len(df)} transactions")
+                new_count = merge_partition(entity_id, account_type, df)
+                entity_sources[account_type] = file.file_id
+                st.sidebar.write(f"**New transactions merged:** {new_count}")
+        if account_type in entity_partitions and entity_sources.get(account_type) == file.file_id:
+            st.sidebar.success(f"✅ {account_types[account_type]}: {len(entity_partitions[account_type])} transactions")
     
-    if all_dfs:
-        st.session_state.transactions = pd.concat(all_dfs, ignore_index=True)
-        st.session_state.transactions = st.session_state.transactions.sort_values('date', ascending=False)
+    df = get_entity_transactions(entity_id)
     
-    if not st.session_state.transactions.empty:
-        df = st.session_state.transactions
-        
-        current_stats = calculate_monthly_stats(df)
+    if not df.empty:
+        current_stats = calculate_monthly_stats(df, entity['rental_accounts'], entity['business_accounts'])
         
         col1, col2, col3, col4, col5 = st.columns(5)
         
@@ -399,14 +577,14 @@ def main():
             if st.button("💾 Save Current Month"):
                 current_date = datetime.now()
                 month_key = f"{current_date.year}-{current_date.month:02d}"
-                st.session_state.monthly_history[month_key] = current_stats
+                entity_history[month_key] = current_stats
                 st.success(f"✅ {month_key} data saved!")
         
         with col2:
             if st.button("📊 View Historical Trends"):
-                if st.session_state.monthly_history:
+                if entity_history:
                     st.subheader("Monthly History")
-                    history_df = pd.DataFrame(st.session_state.monthly_history).T
+                    history_df = pd.DataFrame(entity_history).T
                     history_df.index.name = 'Month'
                     
                     currency_cols = ['rental_income', 'business_income', 'operating_expenses', 'capital_investments', 'net_income']
@@ -416,8 +594,8 @@ def main():
                     
                     st.dataframe(history_df, use_container_width=True)
                     
-                    if len(st.session_state.monthly_history) > 1:
-                        trend_data = pd.DataFrame(st.session_state.monthly_history).T
+                    if len(entity_history) > 1:
+                        trend_data = pd.DataFrame(entity_history).T
                         
                         fig_hist = go.Figure()
                         
@@ -462,7 +640,7 @@ def main():
                 st.subheader("Performance by Property")
                 
                 property_data = []
-                for prop in st.session_state.properties:
+                for prop in properties:
                     prop_transactions = df[df['property'] == prop['id']]
                     if not prop_transactions.empty:
                         prop_income = prop_transactions[prop_transactions['amount'] > 0]['amount'].sum()
@@ -561,7 +739,7 @@ def main():
             show_capital_only = st.checkbox("Capital Investments Only")
         
         with col4:
-            property_filter = st.selectbox("Filter by Property", ['All'] + [prop['id'] for prop in st.session_state.properties])
+            property_filter = st.selectbox("Filter by Property", ['All'] + [prop['id'] for prop in properties])
         
         filtered_df = df.copy()
         
@@ -583,18 +761,64 @@ def main():
             edited_df = st.data_editor(
                 filtered_df.head(100)[['date', 'account', 'description', 'amount', 'category', 'property', 'is_capital', 'notes']],
                 column_config={
-                    'date': st.column_config.DateColumn("Date"),
+                    'date': st.column_config.DateColumn("Date", disabled=True),
                     'account': st.column_config.TextColumn("Account", disabled=True),
-                    'description': st.column_config.TextColumn("Description", width="large"),
-                    'amount': st.column_config.NumberColumn("Amount", format="$%.2f"),
+                    'description': st.column_config.TextColumn("Description", width="large", disabled=True),
+                    'amount': st.column_config.NumberColumn("Amount", format="$%.2f", disabled=True),
                     'category': st.column_config.SelectboxColumn("Category", options=list(AUTO_CATEGORIES.keys()) + ['uncategorized']),
-                    'property': st.column_config.SelectboxColumn("Property", options=[prop['id'] for prop in st.session_state.properties]),
+                    'property': st.column_config.SelectboxColumn("Property", options=[prop['id'] for prop in properties]),
                     'is_capital': st.column_config.CheckboxColumn("Capital Investment"),
                     'notes': st.column_config.TextColumn("Notes", width="medium")
                 },
-                num_rows="dynamic",
                 use_container_width=True
             )
+            
+            edit_columns = ['category', 'property', 'is_capital', 'notes']
+            text_defaults = {'category': 'uncategorized', 'property': '', 'notes': ''}
+            edited_rows = edited_df[edit_columns].fillna(text_defaults)
+            original_rows = df.loc[edited_rows.index, edit_columns].fillna(text_defaults)
+            changed_rows = edited_rows[(edited_rows.astype(str) != original_rows.astype(str)).any(axis=1)]
+            
+            if not changed_rows.empty:
+                changed_rows = changed_rows.astype({'is_capital': bool})
+                for account_type, account_rows in changed_rows.groupby(df.loc[changed_rows.index, 'account']):
+                    partition = entity_partitions[account_type]
+                    previous_rows = partition.loc[account_rows.index].copy()
+                    partition.loc[account_rows.index, edit_columns] = account_rows
+                    adjust_schedule_e_aggregates(entity_id, account_type, partition.loc[account_rows.index], previous_rows)
+                st.rerun()
+        
+        st.subheader("🧾 Schedule E Report")
+        
+        report_years = get_schedule_e_years(entity_id)
+        if report_years:
+            report_year = st.selectbox("Tax Year", report_years, key=f"schedule_e_year_{entity_id}")
+            schedule_e_df = build_schedule_e_report(entity_id, report_year, properties)
+            
+            display_df = schedule_e_df.copy()
+            for col in display_df.columns:
+                display_df[col] = display_df[col].apply(lambda x: f"${x:,.0f}")
+            st.dataframe(display_df, use_container_width=True)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.download_button(
+                    label="Download Schedule E CSV",
+                    data=schedule_e_df.to_csv(),
+                    file_name=f"schedule_e_{entity_id}_{report_year}.csv",
+                    mime="text/csv"
+                )
+            
+            with col2:
+                st.download_button(
+                    label="Download Schedule E HTML",
+                    data=schedule_e_df.to_html(float_format=lambda x: f"{x:,.2f}"),
+                    file_name=f"schedule_e_{entity_id}_{report_year}.html",
+                    mime="text/html"
+                )
+        else:
+            st.info("Assign properties to rental transactions to build the Schedule E report.")
         
         st.subheader("📄 Export Data")
         
@@ -606,7 +830,7 @@ def main():
                 st.download_button(
                     label="Download All Transactions CSV",
                     data=csv,
-                    file_name=f"all_transactions_{datetime.now().strftime('%Y%m%d')}.csv",
+                    file_name=f"all_transactions_{entity_id}_{datetime.now().strftime('%Y%m%d')}.csv",
                     mime="text/csv"
                 )
         
@@ -618,7 +842,7 @@ def main():
                     st.download_button(
                         label="Download Capital Investments CSV",
                         data=csv,
-                        file_name=f"capital_investments_{datetime.now().strftime('%Y%m%d')}.csv",
+                        file_name=f"capital_investments_{entity_id}_{datetime.now().strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
                 else:
@@ -626,13 +850,13 @@ def main():
         
         with col3:
             if st.button("📈 Export Monthly History"):
-                if st.session_state.monthly_history:
-                    history_df = pd.DataFrame(st.session_state.monthly_history).T
+                if entity_history:
+                    history_df = pd.DataFrame(entity_history).T
                     csv = history_df.to_csv()
                     st.download_button(
                         label="Download Monthly History CSV",
                         data=csv,
-                        file_name=f"monthly_history_{datetime.now().strftime('%Y%m%d')}.csv",
+                        file_name=f"monthly_history_{entity_id}_{datetime.now().strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
                 else: